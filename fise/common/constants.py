@@ -89,3 +89,6 @@ DATABASE_URL_DIALECTS = {
     "postgresql": "postgresql://",
     "mysql": "mysql+pymysql://",
 }
+
+# Number of search records inserted at once while exporting to databases.
+SQL_EXPORT_CHUNK_SIZE = 10_000
@@ -6,9 +6,12 @@ This module comprises utility functions supporting
 other classes and functions throughout the project.
 """
 
+import os
 import getpass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Generator, Any
+from typing import Generator, Iterable, Iterator, Any
 
 import numpy as np
 import pandas as pd
@@ -21,13 +24,14 @@ from errors import QueryParseError, OperationError, QueryHandleError
 from notify import Alert
 
 
-def parse_query(query: str) -> list[str]:
+@lru_cache(maxsize=256)
+def _tokenize_query(query: str) -> tuple[str, ...]:
     """
-    Parses the specified raw string query and converts into
-    a list of tokens for further parsing and evaluation.
+    Tokenizes the specified raw string query. The tokens are cached and returned as
+    a tuple to avoid re-tokenizing repeated queries and mutations of the cached result.
 
     #### Params:
-    - query (str): Query to be parsed.
+    - query (str): Query to be tokenized.
     """
 
     delimiters: dict[str, str] = {"[": "]", "(": ")", "'": "'", '"': '"'}
@@ -69,63 +73,234 @@ def parse_query(query: str) -> list[str]:
     if token:
         raise QueryParseError(f"Invalid query syntax around {token[:-1]!r}")
 
-    return tokens
+    return tuple(tokens)
 
 
-def get_files(directory: Path, recursive: bool) -> Generator[Path, None, None]:
+def parse_query(query: str) -> list[str]:
     """
-    Returns a `typing.Generator` object of all files present within the specified directory.
-    Files present within subdirectories are also extracted if `recursive` is set to `True`.
+    Parses the specified raw string query and converts into
+    a list of tokens for further parsing and evaluation.
+
+    #### Params:
+    - query (str): Query to be parsed.
+    """
+    return list(_tokenize_query(query))
+
+
+def _get_directory_key(stats: os.stat_result) -> tuple[int, int]:
+    """
+    Returns the device and inode numbers uniquely identifying the directory
+    corresponding to the specified stats, used for detecting symbolic link cycles.
+
+    #### Params:
+    - stats (os.stat_result): Stats of the directory.
+    """
+    return stats.st_dev, stats.st_ino
+
+
+def _is_cyclic_link(
+    entry: os.DirEntry,
+    ancestors: Iterable[str | Path],
+    keys: list[tuple[int, int]],
+) -> bool:
+    """
+    Returns whether the specified directory entry is a symbolic link pointing
+    to one of the specified ancestor directories, thereby forming a cycle.
+
+    #### Params:
+    - entry (os.DirEntry): Directory entry of the subdirectory.
+    - ancestors (Iterable[str | Path]): Paths to the directories being scanned.
+    - keys (list[tuple[int, int]]): Keys of the leading ancestor directories, which
+    is extended in place with the keys of the remaining ancestor directories.
+    """
+
+    # Regular directories cannot form cycles, and are hence not stated. The stats
+    # are extracted with `os.stat` as the ones cached within `os.DirEntry` objects
+    # do not comprise the device and inode numbers on Windows.
+    if not entry.is_symlink():
+        return False
+
+    key: tuple[int, int] = _get_directory_key(os.stat(entry.path))
+
+    # Only states the ancestor directories whose keys have not been extracted yet.
+    for path in islice(ancestors, len(keys), None):
+        keys.append(_get_directory_key(os.stat(path)))
+
+    return key in keys
+
+
+def get_file_entries(
+    directory: Path, recursive: bool
+) -> Generator[os.DirEntry, None, None]:
+    """
+    Returns a `typing.Generator` object of `os.DirEntry` objects of all files present within
+    the specified directory. Files present within subdirectories are also extracted if
+    `recursive` is set to `True`.
 
     #### Params:
     - directory (pathlib.Path): Path to the directory.
     - recursive (bool): Whether to include files from subdirectories.
     """
 
-    try:
-        for path in directory.iterdir():
-            if path.is_file():
-                yield path
+    # Stores the paths of the directories being scanned along with iterators of their
+    # entries. An explicit stack is used in place of recursion to avoid creating a
+    # generator for every subdirectory, while preserving the order of the entries.
+    stack: list[tuple[str | Path, Iterator[os.DirEntry]]] = []
+
+    # Device and inode numbers of the leading directories in the stack, which
+    # are only extracted once a symbolic link is found for detecting cycles.
+    keys: list[tuple[int, int]] = []
 
-            # Extracts files from sub-directories.
-            elif recursive and path.is_dir():
-                yield from get_files(path, recursive)
+    try:
+        # `os.scandir` is used as the type of the entries is mostly cached
+        # within the `os.DirEntry` objects without requiring a `stat` call.
+        stack.append((directory, os.scandir(directory)))
 
     except PermissionError:
         Alert(f"Permission Error: Skipping directory '{directory}'")
 
-        # Yields from an empty tuple to not disrupt
-        # the proper functioning of the function.
-        yield from ()
+    try:
+        while stack:
+            for entry in stack[-1][1]:
+                if entry.is_file():
+                    yield entry
+                    continue
 
+                if not (recursive and entry.is_dir()):
+                    continue
 
-def get_directories(directory: Path, recursive: bool) -> Generator[Path, None, None]:
+                try:
+                    # Skips the subdirectory if it links back to one of
+                    # the directories being scanned forming a cycle.
+                    if _is_cyclic_link(entry, (path for path, _ in stack), keys):
+                        continue
+
+                    stack.append((entry.path, os.scandir(entry.path)))
+
+                except PermissionError:
+                    Alert(f"Permission Error: Skipping directory '{entry.path}'")
+
+                except OSError:
+                    Alert(f"OS Error: Skipping directory '{entry.path}'")
+
+                else:
+                    # Breaks the loop to scan the subdirectory pushed onto the stack.
+                    break
+
+            else:
+                stack.pop()[1].close()
+                del keys[len(stack):]
+
+    finally:
+        # Closes the iterators left open if the generator is closed midway.
+        for _, entries in stack:
+            entries.close()
+
+
+def get_files(directory: Path, recursive: bool) -> Generator[Path, None, None]:
     """
-    Returns a `typing.Generator` object of all subdirectories present within the specified
-    directory. Directories present within subdirectories are also extracted if `recursive`
-    is set to `True`.
+    Returns a `typing.Generator` object of all files present within the specified directory.
+    Files present within subdirectories are also extracted if `recursive` is set to `True`.
 
     #### Params:
     - directory (pathlib.Path): Path to the directory.
     - recursive (bool): Whether to include files from subdirectories.
     """
+    for entry in get_file_entries(directory, recursive):
+        yield Path(entry.path)
 
-    try:
-        for path in directory.iterdir():
-            if not path.is_dir():
-                continue
 
-            if recursive:
-                yield from get_directories(path, recursive)
+def get_directory_entries(
+    directory: Path, recursive: bool
+) -> Generator[os.DirEntry, None, None]:
+    """
+    Returns a `typing.Generator` object of `os.DirEntry` objects of all subdirectories
+    present within the specified directory. Directories present within subdirectories
+    are also extracted if `recursive` is set to `True`.
+
+    #### Params:
+    - directory (pathlib.Path): Path to the directory.
+    - recursive (bool): Whether to include files from subdirectories.
+    """
+
+    # Stores the entries of the directories being scanned along with iterators of their
+    # entries. The directories are only yielded once all their subdirectories have been
+    # yielded to allow safe removal of the directories during iteration. The entry of the
+    # specified directory is stored as `None` as it is not yielded.
+    stack: list[tuple[os.DirEntry | None, Iterator[os.DirEntry]]] = []
 
-            yield path
+    # Device and inode numbers of the leading directories in the stack, which
+    # are only extracted once a symbolic link is found for detecting cycles.
+    keys: list[tuple[int, int]] = []
+
+    try:
+        stack.append((None, os.scandir(directory)))
 
     except PermissionError:
         Alert(f"Permission Error: Skipping directory '{directory}'")
 
-        # Yields from an empty tuple to not disrupt
-        # the proper functioning of the function.
-        yield from ()
+    try:
+        while stack:
+            current, entries = stack[-1]
+
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                if not recursive:
+                    yield entry
+                    continue
+
+                try:
+                    # Yields the subdirectory without scanning it if it links back
+                    # to one of the directories being scanned forming a cycle.
+                    if _is_cyclic_link(
+                        entry, (i.path if i else directory for i, _ in stack), keys
+                    ):
+                        yield entry
+                        continue
+
+                    stack.append((entry, os.scandir(entry.path)))
+
+                except PermissionError:
+                    Alert(f"Permission Error: Skipping directory '{entry.path}'")
+                    yield entry
+
+                except OSError:
+                    Alert(f"OS Error: Skipping directory '{entry.path}'")
+                    yield entry
+
+                else:
+                    # Breaks the loop to scan the subdirectory pushed onto the stack.
+                    break
+
+            else:
+                stack.pop()
+                entries.close()
+                del keys[len(stack):]
+
+                # Yields the directory as all of its subdirectories have been yielded.
+                if current is not None:
+                    yield current
+
+    finally:
+        # Closes the iterators left open if the generator is closed midway.
+        for _, entries in stack:
+            entries.close()
+
+
+def get_directories(directory: Path, recursive: bool) -> Generator[Path, None, None]:
+    """
+    Returns a `typing.Generator` object of all subdirectories present within the specified
+    directory. Directories present within subdirectories are also extracted if `recursive`
+    is set to `True`.
+
+    #### Params:
+    - directory (pathlib.Path): Path to the directory.
+    - recursive (bool): Whether to include files from subdirectories.
+    """
+    for entry in get_directory_entries(directory, recursive):
+        yield Path(entry.path)
 
 
 def export_to_file(data: pd.DataFrame, file: Path) -> None:
@@ -226,7 +401,15 @@ def export_to_sql(data: pd.DataFrame, database: str) -> None:
                 # Raises `QueryHandleError` without any message to terminate the current query.
                 raise QueryHandleError
 
-        data.to_sql(table, conn, if_exists="replace", index=False)
+        # Inserts the records in chunks to avoid converting all of them into
+        # row parameters at once, which would duplicate the whole data in memory.
+        data.to_sql(
+            table,
+            conn,
+            if_exists="replace",
+            index=False,
+            chunksize=constants.SQL_EXPORT_CHUNK_SIZE,
+        )
 
     finally:
         conn.close()
@@ -41,20 +41,22 @@ def evaluate_query() -> None:
     global EXIT, CLEAR
 
     query: str = input("FiSE> ")
-    start_time: float = time.perf_counter()
 
     if not query:
         return
 
-    elif query.lower() in EXIT:
+    lowered: str = query.lower()
+
+    if lowered in EXIT:
         sys.exit(0)
 
-    elif query.lower() in CLEAR:
+    elif lowered in CLEAR:
         return print("\033c", end="")
 
     # If none of the above conditions are matched, the input
     # is assumed to be a query and evaluated accordingly.
 
+    start_time: float = time.perf_counter()
     handler = QueryHandler(query)
     data: pd.DataFrame | None = handler.handle()
 
@@ -8,12 +8,18 @@ of platform-specific tasks across diverse environments.
 """
 
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Any
 from datetime import datetime
 
 from notify import Alert
 
+if sys.platform != "win32":
+    import pwd
+    import grp
+
 
 def _field_extraction_alert() -> None:
     """
@@ -33,6 +39,43 @@ def _field_extraction_alert() -> None:
     BaseEntity.field_alert = True
 
 
+@lru_cache(maxsize=4096)
+def _get_datetime(timestamp: int) -> datetime:
+    """
+    Converts the specified timestamp in whole seconds into a `datetime` object. The
+    results are cached as they are repeatedly requested for entities sharing the same
+    timestamps and for fields accessed in both query conditions and the projection.
+
+    #### Params:
+    - timestamp (int): Timestamp in seconds since the epoch.
+    """
+    return datetime.fromtimestamp(timestamp)
+
+
+@lru_cache(maxsize=1024)
+def _get_owner(uid: int) -> str:
+    """
+    Returns the name of the user corresponding to the specified user ID. The results
+    are cached as the same IDs are repeatedly resolved for the recorded entities.
+
+    #### Params:
+    - uid (int): User ID of the owner.
+    """
+    return pwd.getpwuid(uid).pw_name
+
+
+@lru_cache(maxsize=1024)
+def _get_group(gid: int) -> str:
+    """
+    Returns the name of the group corresponding to the specified group ID. The results
+    are cached as the same IDs are repeatedly resolved for the recorded entities.
+
+    #### Params:
+    - gid (int): Group ID of the group.
+    """
+    return grp.getgrgid(gid).gr_name
+
+
 def safe_extract_field(func: Callable[..., Any]) -> Callable[..., Any] | None:
     """
     Safely executes the specified field extraction
@@ -59,47 +102,75 @@ class BaseEntity:
     # been encountered to only alert the user once during the operation.
     field_alert = False
 
-    __slots__ = "_path", "_stats"
+    __slots__ = "_path", "_entry", "_stat_result"
 
     def __init__(self, path: Path) -> None:
         """
         Creates an instance of the `BaseEntity` class.
 
         #### Params:
-        - file (pathlib.Path): path to the file/directory.
+        - path (pathlib.Path): path to the file/directory.
         """
         self._path: Path = path
-        self._stats: os.stat_result = path.stat()
+        self._entry: os.DirEntry | None = None
+        self._stat_result: os.stat_result | None = path.stat()
+
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry) -> "BaseEntity":
+        """
+        Creates an instance of the class from the specified `os.DirEntry` object.
+        The stats are only extracted from the entry upon accessing a field
+        dependent on them, and are cached by the entry on some platforms.
+
+        #### Params:
+        - entry (os.DirEntry): Directory entry of the file/directory.
+        """
+
+        entity = cls.__new__(cls)
+
+        entity._path = Path(entry.path)
+        entity._entry = entry
+        entity._stat_result = None
+
+        return entity
+
+    @property
+    def _stats(self) -> os.stat_result:
+        # Extracts and stores the stats upon first access if not extracted yet.
+        if self._stat_result is None:
+            self._stat_result = self._entry.stat()
+
+        return self._stat_result
+
+    # Fields derived from the path alone cannot fail, and are hence
+    # not wrapped with `safe_extract_field` to avoid the call overhead.
 
     @property
-    @safe_extract_field
     def name(self) -> str:
         return self._path.name
 
     @property
-    @safe_extract_field
     def path(self) -> str:
         return self._path.as_posix()
 
     @property
-    @safe_extract_field
     def parent(self) -> str:
         return self._path.parent.as_posix()
 
     @property
     @safe_extract_field
     def access_time(self) -> datetime:
-        return datetime.fromtimestamp(self._stats.st_atime).replace(microsecond=0)
+        return _get_datetime(self._stats.st_atime_ns // 1_000_000_000)
 
     @property
     @safe_extract_field
     def create_time(self) -> datetime:
-        return datetime.fromtimestamp(self._stats.st_ctime).replace(microsecond=0)
+        return _get_datetime(self._stats.st_ctime_ns // 1_000_000_000)
 
     @property
     @safe_extract_field
     def modify_time(self) -> datetime:
-        return datetime.fromtimestamp(self._stats.st_mtime).replace(microsecond=0)
+        return _get_datetime(self._stats.st_mtime_ns // 1_000_000_000)
 
 
 class WindowsEntity(BaseEntity):
@@ -109,7 +180,7 @@ class WindowsEntity(BaseEntity):
     `pathlib.Path` and `os.stat_result` object.
     """
 
-    __slots__ = "_path", "_stats"
+    __slots__ = ()
 
 
 class PosixEntity(BaseEntity):
@@ -119,17 +190,32 @@ class PosixEntity(BaseEntity):
     `pathlib.Path` and `os.stat_result` object.
     """
 
-    __slots__ = "_path", "_stats"
+    __slots__ = ()
+
+    # Posix paths are already separated with forward slashes, hence the string form
+    # of the path, which is cached within the `pathlib.Path` object, is used directly
+    # instead of reallocating it with `Path.as_posix`.
+
+    @property
+    def path(self) -> str:
+        return str(self._path)
+
+    @property
+    def parent(self) -> str:
+        # Avoids creating an additional `pathlib.Path` object for the parent.
+        return os.path.dirname(str(self._path)) or "."
 
     @property
     @safe_extract_field
     def owner(self) -> str:
-        return self._path.owner()
+        # Resolves the name from the stored stats as `Path.owner`
+        # and `Path.group` individually stat the path again.
+        return _get_owner(self._stats.st_uid)
 
     @property
     @safe_extract_field
     def group(self) -> str:
-        return self._path.group()
+        return _get_group(self._stats.st_gid)
 
     @property
     @safe_extract_field
@@ -6,9 +6,8 @@ This package provides a collection of classes and functions
 designed for handling user-specified search and delete queries.
 """
 
-import re
 from pathlib import Path
-from typing import Callable, Generator
+from typing import Generator
 
 import pandas as pd
 
@@ -27,11 +26,7 @@ class QueryHandler:
     processing user-specified search and delete queries.
     """
 
-    __slots__ = "_query", "_ctr", "_handler_map"
-
-    # Regular expression patterns for parsing sub-queries.
-    _export_subquery_pattern = re.compile(r"^(sql|file)\[.*]$")
-    _operation_params_pattern = re.compile(r"^(\[.*])?$")
+    __slots__ = "_query", "_ctr"
 
     def __init__(self, query: str) -> None:
         """
@@ -41,13 +36,6 @@ class QueryHandler:
         - query (str): Query to be handled.
         """
 
-        # Maps targeted operands names with corresponding methods for handling the query.
-        self._handler_map: dict[str, Callable[[QueryInitials], pd.DataFrame | None]] = {
-            "file": self._handle_file_query,
-            "dir": self._handle_dir_query,
-            "data": self._handle_data_query,
-        }
-
         # Keeps track of the current position of the token to be parsed in the query.
         self._ctr = 0
 
@@ -66,11 +54,19 @@ class QueryHandler:
         except IndexError:
             raise QueryParseError("Invalid query syntax.")
 
+        data: pd.DataFrame | None
+
         # Calls the corresponding handler method, extracts, and stores the
         # search records if search operation is specified else stores `None`.
-        data: pd.DataFrame | None = self._handler_map[initials.operation.operand](
-            initials
-        )
+        match initials.operation.operand:
+            case "file":
+                data = self._handle_file_query(initials)
+
+            case "dir":
+                data = self._handle_dir_query(initials)
+
+            case _:
+                data = self._handle_data_query(initials)
 
         if not initials.export:
             return data
@@ -113,7 +109,9 @@ class QueryHandler:
             query.path, initials.recursive, initials.operation.filemode
         )
 
-        return operator.get_dataframe(query.fields, query.columns, query.condition)
+        return operator.get_dataframe(
+            query.fields, query.columns, query.condition, query.file_condition
+        )
 
     def _handle_dir_query(self, initials: QueryInitials) -> pd.DataFrame | None:
         """
@@ -164,7 +162,7 @@ class QueryHandler:
         return type_
 
     def _parse_search_operation(
-        self, params: Generator[list[str], None, None]
+        self, params: Generator[tuple[str, str | None], None, None]
     ) -> OperationData:
         """
         Parses the search operation parameters.
@@ -174,15 +172,12 @@ class QueryHandler:
         filemode: str | None = None
 
         # Iterates through the parameters and parses them.
-        for param in params:
-            if len(param) != 2:
+        for key, value in params:
+            if value is None:
                 raise QueryParseError(
                     f"Invalid query syntax around {self._query[self._ctr]!r}"
                 )
 
-            # Splits the key-value pair in the list into variables for better readability.
-            key, value = param
-
             if key == "type":
                 operand = self._parse_operation_type(value)
 
@@ -210,7 +205,7 @@ class QueryHandler:
         return OperationData("search", operand, filemode)
 
     def _parse_delete_operation(
-        self, params: Generator[list[str], None, None]
+        self, params: Generator[tuple[str, str | None], None, None]
     ) -> OperationData:
         """
         Parses the delete operation parameters.
@@ -220,21 +215,26 @@ class QueryHandler:
         skip_err: bool = False
 
         # Iterates through the parameters and parses them.
-        for param in params:
+        for key, value in params:
+            if key == "type":
+                if value is None:
+                    raise QueryParseError(
+                        f"Invalid query syntax around {self._query[self._ctr]!r}"
+                    )
 
-            if param[0] == "type":
-                operand = self._parse_operation_type(param[1])
+                operand = self._parse_operation_type(value)
 
-            elif param[0] == "skip_err":
-                if len(param) != 1:
+            elif key == "skip_err":
+                if value is not None:
                     raise QueryParseError(
                         f"Invalid query syntax around {self._query[self._ctr]!r}"
                     )
 
                 skip_err = True
+
             else:
                 raise QueryParseError(
-                    f"Invalid parameter {param[0]!r} for delete operation."
+                    f"Invalid parameter {key!r} for delete operation."
                 )
 
         if operand == "data":
@@ -249,43 +249,57 @@ class QueryHandler:
         Parses the query operation specifications.
         """
 
-        # Extracts and stores the operation and its parameter specifications.
-        operation, oparams = (
-            self._query[self._ctr][:6].lower(),
-            self._query[self._ctr][6:].lower(),
-        )
+        # Lowers the operation token once and extracts the
+        # operation and its parameter specifications from it.
+        token: str = self._query[self._ctr].lower()
+        operation, oparams = token[:6], token[6:]
 
         if operation not in constants.OPERATION_ALIASES:
             raise QueryParseError(
                 f"Invalid operation {operation!r} specified in the query"
             )
 
-        # Verifying operation parameters syntax.
-        if not self._operation_params_pattern.match(oparams):
+        # Verifies whether the operation parameters, if specified, are enclosed in brackets.
+        if oparams and not (oparams.startswith("[") and oparams.endswith("]")):
             raise QueryParseError(
                 f"Invalid query syntax around {self._query[self._ctr]!r}."
             )
 
-        # Splits the parameters subquery about commas, and iterates
-        # through it striping whitespaces from individual parameters.
-        params: Generator[list[str], None, None] = (
-            i.strip().split(" ") for i in oparams[1:-1].split(",") if i
+        params: Generator[tuple[str, str | None], None, None] = (
+            self._iter_params(oparams)
         )
 
-        try:
-            data: OperationData = (
-                self._parse_search_operation(params)
-                if operation == "select"
-                else self._parse_delete_operation(params)
-            )
+        return (
+            self._parse_search_operation(params)
+            if operation == "select"
+            else self._parse_delete_operation(params)
+        )
 
-        except IndexError:
-            raise QueryParseError(
-                f"Invalid query syntax around {self._query[self._ctr]!r}"
-            )
+    def _iter_params(
+        self, oparams: str
+    ) -> Generator[tuple[str, str | None], None, None]:
+        """
+        Splits the operation parameters subquery about commas, and yields the individual
+        parameters as key-value pairs with the value as `None` if not specified.
 
-        else:
-            return data
+        #### Params:
+        - oparams (str): Operation parameters subquery enclosed within brackets.
+        """
+
+        for param in oparams[1:-1].split(","):
+            if not param:
+                continue
+
+            # Strips whitespaces from the parameter and splits it into its key and value.
+            key, _, value = param.strip().partition(" ")
+
+            # Parameters comprising multiple values or whitespaces are invalid.
+            if " " in value:
+                raise QueryParseError(
+                    f"Invalid query syntax around {self._query[self._ctr]!r}"
+                )
+
+            yield key, value or None
 
     @staticmethod
     def _parse_file_export_specs(export_specs: str) -> ExportData:
@@ -345,7 +359,8 @@ class QueryHandler:
         self._ctr += 2
         low_target: str = self._query[1].lower()
 
-        if not self._export_subquery_pattern.match(low_target):
+        # Verifies whether the specifications are in the `file[...]` or `sql[...]` format.
+        if not (low_target.startswith(("file[", "sql[")) and low_target.endswith("]")):
             raise QueryParseError(
                 "Unable to parse the export specifications in the query."
             )
@@ -8,11 +8,105 @@ conditions, and filtering file, data and directory records.
 
 import re
 from datetime import datetime
+from operator import ge, le, lt, gt, eq, ne
+from functools import partial
 from typing import Generator, Callable, Any
 
 from common import constants, tools
 from errors import QueryParseError, OperationError
-from shared import File, DataLine, Directory, Field, Condition, Size
+from shared import File, DataLine, Directory, Field, Condition, Size, always_true
+
+
+def _contains(x: Any, y: list[Any], /) -> bool:
+    return x in y
+
+
+def _between(x: Any, y: tuple[Any, Any], /) -> bool:
+    return y[0] <= x <= y[1]
+
+
+def _like(string: str, pattern: re.Pattern, /) -> bool:
+    return bool(pattern.match(string))
+
+
+# Maps operator notations with corresponding opcodes which are stored within the
+# parsed `Condition` objects and used as indices for the `_OPERATORS` tuple below.
+_OPCODES: dict[str, int] = {
+    ">=": 0, "<=": 1, "<": 2, ">": 3, "=": 4,
+    "!=": 5, "like": 6, "in": 7, "between": 8,
+}
+
+# Evaluation functions for individual operators ordered by their opcodes.
+_OPERATORS: tuple[Callable[[Any, Any], bool], ...] = (
+    ge, le, lt, gt, eq, ne, _like, _contains, _between
+)
+
+
+def _split_tuple(body: str) -> list[str]:
+    """
+    Splits the body of a tuple operand at the commas which are not enclosed
+    within quotes and returns a list of the stripped individual operands.
+
+    #### Params:
+    - body (str): Tuple operand without the enclosing parentheses.
+    """
+
+    operands: list[str] = []
+
+    # Stores the index of the beginning of the current operand and the
+    # quote enclosing the current character, if any, during iteration.
+    start: int = 0
+    quote: str = ""
+
+    for index, char in enumerate(body):
+        if quote:
+            if char == quote:
+                quote = ""
+
+        elif char in "'\"":
+            quote = char
+
+        elif char == ",":
+            operands.append(body[start:index].strip())
+            start = index + 1
+
+    operands.append(body[start:].strip())
+
+    return operands
+
+
+# Data search fields which are shared by all the datalines of a file.
+_FILE_DATA_FIELDS = frozenset(("name", "path", "filetype"))
+
+
+def _is_file_condition(condition: Condition | list[Condition | str | list]) -> bool:
+    """
+    Verifies whether the specified condition only comprises fields
+    shared by all the datalines of a file in data search operations.
+
+    #### Params:
+    - condition (Condition | list): Condition(s) to be verified.
+    """
+
+    # Recursively verifies all the conditions if the condition is nested.
+    if isinstance(condition, list):
+        return all(
+            _is_file_condition(i) for i in condition if not isinstance(i, str)
+        )
+
+    operands: list[Any] = [condition.operand1]
+
+    if isinstance(condition.operand2, list):
+        operands.extend(condition.operand2)
+
+    else:
+        operands.append(condition.operand2)
+
+    return all(
+        operand.field in _FILE_DATA_FIELDS
+        for operand in operands
+        if isinstance(operand, Field)
+    )
 
 
 class ConditionParser:
@@ -21,7 +115,7 @@ class ConditionParser:
     conditions for search and delete operations.
     """
 
-    __slots__ = "_query", "_method_map", "_lookup_fields", "_field_aliases"
+    __slots__ = "_query", "_lookup_fields", "_field_aliases"
 
     # Regular expression patterns for matching fields in query conditions.
     _tuple_pattern = re.compile(r"^\(.*\)$")
@@ -65,6 +159,15 @@ class ConditionParser:
         if not self._datetime_pattern.match(operand):
             return None
 
+        try:
+            # Attempts to parse the operand with `datetime.fromisoformat` first as it is
+            # considerably faster than `datetime.strptime`, which is only used as a
+            # fallback for date and time values which are not zero-padded.
+            return datetime.fromisoformat(operand)
+
+        except ValueError:
+            ...
+
         try:
             return datetime.strptime(operand, r"%Y-%m-%d %H:%M:%S")
 
@@ -144,7 +247,7 @@ class ConditionParser:
 
         # Parses and creates a list of individual operands.
         operands: list[Any] = [
-            self._parse_comparison_operand(i.strip()) for i in operand[1:-1].split(",")
+            self._parse_comparison_operand(i) for i in _split_tuple(operand[1:-1])
         ]
 
         if operator == "between" and len(operands) != 2:
@@ -264,7 +367,7 @@ class ConditionParser:
             else self._parse_conditional_operand(condition[2], operator)
         )
 
-        return Condition(operand1, operator, operand2)
+        return Condition(operand1, _OPCODES[operator], operand2)
 
     def _parse_conditions(
         self, subquery: list[str]
@@ -309,7 +412,7 @@ class ConditionHandler:
     query conditions for search and delete operations.
     """
 
-    __slots__ = "_conditions", "_method_map"
+    __slots__ = ("_conditions",)
 
     def __init__(self, subquery: list[str], operation_target: str) -> None:
         """
@@ -320,19 +423,6 @@ class ConditionHandler:
         - operation_target (str): Targeted operand in the operation (file/data/directory).
         """
 
-        # Maps operator notations with corresponding evaluation methods.
-        self._method_map: dict[str, Callable[[Any, Any], bool]] = {
-            ">=": self._ge,
-            "<=": self._le,
-            "<": self._lt,
-            ">": self._gt,
-            "=": self._eq,
-            "!=": self._ne,
-            "like": self._like,
-            "in": self._contains,
-            "between": self._between,
-        }
-
         # Parses the conditions and stores them in a list.
         self._conditions = list(
             ConditionParser(subquery, operation_target).parse_conditions()
@@ -402,9 +492,9 @@ class ConditionHandler:
         ), self._eval_operand(condition.operand2, obj)
 
         try:
-            # Evaluates the operation with a method corresponding to the name
-            # of the operator defined in the `_method_map` instance attribute.
-            response: bool = self._method_map[condition.operator](operand1, operand2)
+            # Evaluates the operation with the function corresponding
+            # to the opcode of the operator in the `_OPERATORS` tuple.
+            response: bool = _OPERATORS[condition.operator](operand1, operand2)
         except (TypeError, ValueError):
             raise OperationError("Unable to process the query conditions.")
 
@@ -480,47 +570,37 @@ class ConditionHandler:
 
         return result
 
-    def eval_conditions(self, obj: File | DataLine | Directory) -> bool:
+    def get_file_condition(self) -> Callable[[DataLine], bool]:
         """
-        Evaluates the query conditions
-
-        #### Params:
-        - obj (File | DataLine | Directory): Metadata object for extracting field values.
+        Returns a function for filtering files in data search operations prior to
+        reading them. Only the conditions comprising fields shared by all the datalines
+        of a file and joined by the `and` operator with the remaining conditions are
+        evaluated, as any dataline of a file failing them is bound to be excluded.
         """
-        return self._eval_all_conditions(self._conditions, obj)
-
-    @staticmethod
-    def _gt(x: Any, y: Any, /) -> bool:
-        return x > y
-
-    @staticmethod
-    def _ge(x: Any, y: Any, /) -> bool:
-        return x >= y
 
-    @staticmethod
-    def _lt(x: Any, y: Any, /) -> bool:
-        return x < y
+        # Files cannot be filtered individually if any of the
+        # conditions are separated by the `or` operator.
+        if "or" in self._conditions[1::2]:
+            return always_true
 
-    @staticmethod
-    def _le(x: Any, y: Any, /) -> bool:
-        return x <= y
+        conditions: list[Condition | list] = [
+            i for i in self._conditions[::2] if _is_file_condition(i)
+        ]
 
-    @staticmethod
-    def _eq(x: Any, y: Any, /) -> bool:
-        return x == y
+        if not conditions:
+            return always_true
 
-    @staticmethod
-    def _ne(x: Any, y: Any, /) -> bool:
-        return x != y
+        # Rejoins the extracted conditions with the `and` operator.
+        for index in range(len(conditions) - 1, 0, -1):
+            conditions.insert(index, "and")
 
-    @staticmethod
-    def _contains(x: Any, y: list[Any], /) -> bool:
-        return x in y
+        return partial(self._eval_all_conditions, conditions)
 
-    @staticmethod
-    def _between(x: Any, y: tuple[Any, Any], /) -> bool:
-        return y[0] <= x <= y[1]
+    def eval_conditions(self, obj: File | DataLine | Directory) -> bool:
+        """
+        Evaluates the query conditions
 
-    @staticmethod
-    def _like(string: str, pattern: re.Pattern) -> bool:
-        return bool(pattern.match(string))
+        #### Params:
+        - obj (File | DataLine | Directory): Metadata object for extracting field values.
+        """
+        return self._eval_all_conditions(self._conditions, obj)
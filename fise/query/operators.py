@@ -7,16 +7,69 @@ directory search or delete operations. Additionally, it includes specialized cla
 performing search operations within file contents.
 """
 
-from typing import Generator, Callable, Any
+from typing import Generator, Iterator, Iterable, Callable, Any
+from operator import attrgetter
 from pathlib import Path
 import shutil
+import os
+import io
 
+import numpy as np
 import pandas as pd
 
 from errors import OperationError
 from notify import Message, Alert
 from common import tools, constants
-from shared import File, Directory, DataLine, Field, Size
+from shared import File, Directory, DataLine, Field, Size, always_true
+
+
+def _build_dataframe(
+    records: Iterable[File | DataLine | Directory],
+    fields: list[Field | Size],
+    columns: list[str],
+) -> pd.DataFrame:
+    """
+    Builds a pandas DataFrame from the specified records by extracting
+    the specified fields column-wise rather than row-wise.
+
+    #### Params:
+    - records (Iterable): Iterable of records to extract the fields from.
+    - fields (list[Field | Size]): List of the desired metadata fields.
+    - columns (list[str]): List of column names for the specified fields.
+    """
+
+    # Extracts the fields into individual columns while traversing the records
+    # once, allowing each record to be released once its fields are extracted.
+    columns_data: list[list[Any]] = [[] for _ in fields]
+    extractors: list[tuple[Callable[[Any], None], attrgetter]] = [
+        (column.append, attrgetter("size" if isinstance(field, Size) else field.field))
+        for column, field in zip(columns_data, fields)
+    ]
+
+    for record in records:
+        for append, getter in extractors:
+            append(getter(record))
+
+    if not (columns_data and columns_data[0]):
+        return pd.DataFrame(columns=columns)
+
+    # The columns are keyed by their indices to preserve duplicate
+    # column names, and are renamed with the specified names later.
+    data: dict[int, Any] = {}
+
+    for index, (field, column) in enumerate(zip(fields, columns_data)):
+        # Converts all the sizes into the specified unit at once. Sizes which
+        # could not be extracted are stored as `None` and are marked as NaN.
+        data[index] = (
+            field.get_sizes(np.array(column, dtype=np.float64))
+            if isinstance(field, Size)
+            else column
+        )
+
+    dataframe = pd.DataFrame(data)
+    dataframe.columns = columns
+
+    return dataframe
 
 
 class FileQueryOperator:
@@ -39,21 +92,6 @@ class FileQueryOperator:
         self._directory = directory
         self._recursive = recursive
 
-    @staticmethod
-    def _get_field(field: Field | Size, file: File) -> Any:
-        """
-        Extracts the specified field from the specified `File` object.
-
-        #### Params:
-        - field (Field): `Field` object comprising the field to be extracted.
-        - file (File): `File` object to extract data from.
-        """
-
-        if isinstance(field, Size):
-            return field.get_size(file)
-        
-        return getattr(file, field.field)
-
     def get_dataframe(
         self,
         fields: list[Field | Size],
@@ -70,19 +108,16 @@ class FileQueryOperator:
         - condition (Callable): Function for filtering data records.
         """
 
-        files: Generator[File, None, None] = (
-            File(file) for file in tools.get_files(self._directory, self._recursive)
+        files: Iterator[File] = (
+            File.from_entry(entry)
+            for entry in tools.get_file_entries(self._directory, self._recursive)
         )
 
-        # Generator object comprising search records of
-        # the files matching the specified condition.
-        records: Generator[list[Any], None, None] = (
-            [self._get_field(field, file) for field in fields]
-            for file in files
-            if condition(file)
-        )
+        # Filters the files only if conditions are explicitly defined in the query.
+        if condition is not always_true:
+            files = filter(condition, files)
 
-        return pd.DataFrame(records, columns=columns)
+        return _build_dataframe(files, fields, columns)
 
     def remove_files(self, condition: Callable[[File], bool], skip_err: bool) -> None:
         """
@@ -98,20 +133,24 @@ class FileQueryOperator:
         # the number of skipped files if `skip_err` is set to `True`.
         ctr = skipped = 0
 
+        # Avoids creating `File` objects for evaluating the condition
+        # if no conditions are explicitly defined in the query.
+        evaluate: bool = condition is not always_true
+
         # Iterates through the files and deletes individually if the condition is met.
-        for file in tools.get_files(self._directory, self._recursive):
-            if not condition(File(file)):
+        for entry in tools.get_file_entries(self._directory, self._recursive):
+            if evaluate and not condition(File.from_entry(entry)):
                 continue
 
             try:
-                file.unlink()
+                os.unlink(entry.path)
 
             except PermissionError:
                 if skip_err:
                     skipped += 1
                     continue
 
-                raise OperationError(f"Permission Error: Cannot delete '{file}'")
+                raise OperationError(f"Permission Error: Cannot delete '{entry.path}'")
 
             else:
                 ctr += 1
@@ -133,6 +172,9 @@ class FileDataQueryOperator:
 
     __slots__ = "_path", "_recursive", "_filemode"
 
+    # Size in bytes up to which files are read at once rather than streamed.
+    _max_read_size = 65_536
+
     def __init__(
         self, path: Path, recursive: bool, filemode: constants.FILE_MODES
     ) -> None:
@@ -149,59 +191,96 @@ class FileDataQueryOperator:
         self._recursive = recursive
         self._filemode = constants.FILE_MODES_MAP[filemode]
 
-    def _get_filedata(self) -> Generator[tuple[Path, list[str | bytes]], None, None]:
+    def _get_files(self) -> tuple[Path] | Generator[Path, None, None]:
         """
-        Yields the file paths along with a list comprising datalines
-        of the corresponding file in the form of strings or bytes.
+        Returns a Generator object of all the files present within the directory
+        if the specified path is a directory or a tuple comprising the
+        `pathlib.Path` object of the specified file.
         """
 
-        # The following variable stores a Generator object of all the files present within
-        # the directory if the specified path is a directory or creates a tuple comprising
-        # the `pathlib.Path` object of the specified file.
-        files: tuple[Path] | Generator[Path, None, None] = (
+        return (
             (self._path,) if self._path.is_file() else tools.get_files(
                 self._path, self._recursive
             )
         )
 
-        for i in files:
-            with i.open(self._filemode) as file:
-                try:
-                    yield i, file.readlines()
+    def _read_datalines(self, file: Path) -> Generator[str | bytes, None, None]:
+        """
+        Yields the datalines of the specified file in the form of strings or bytes.
+
+        #### Params:
+        - file (pathlib.Path): Path to the file.
+        """
+
+        # Opens the file in binary mode on Windows to avoid newline translations
+        # and truncation at the end-of-file character with the CRT text mode.
+        fd: int = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+        try:
+            # Streams the datalines from larger files through a file object instead
+            # of reading all of them at once to limit memory usage.
+            if os.fstat(fd).st_size > self._max_read_size:
+                with open(fd, self._filemode, closefd=False) as stream:
+                    yield from stream
 
-                except UnicodeDecodeError:
-                    raise OperationError(
-                        "Cannot read bytes with 'text' filemode. Set "
-                        "filemode to 'bytes' to read byte data within files."
-                    )
+                return
 
-    def _search_datalines(self) -> Generator[DataLine, None, None]:
+            # Smaller files are read directly with `os.read` as creating a file object
+            # for each of them is considerably expensive in comparison to reading it.
+            chunks: list[bytes] = []
+
+            while chunk := os.read(fd, self._max_read_size):
+                chunks.append(chunk)
+
+        finally:
+            os.close(fd)
+
+        buffer = io.BytesIO(b"".join(chunks))
+
+        # Wraps the buffer in the same manner as `open` does in text mode to
+        # preserve the default encoding and universal newlines behaviour.
+        yield from buffer if self._filemode == "rb" else io.TextIOWrapper(buffer)
+
+    def _search_datalines(
+        self, file_condition: Callable[[DataLine], bool]
+    ) -> Generator[DataLine, None, None]:
         """
         Iterates through the files and their corresponding data-lines, and
         yields `DataLine` objects comprising the dataline and its metadata.
+
+        #### Params:
+        - file_condition (Callable): Function for filtering files prior to reading them.
         """
 
-        for file, data in self._get_filedata():
-            yield from (
-                DataLine(file, line, index + 1) for index, line in enumerate(data)
-            )
+        # Avoids evaluating the files if no file conditions are defined in the query.
+        evaluate: bool = file_condition is not always_true
 
-    @staticmethod
-    def _get_field(field: Field, data: DataLine) -> Any:
-        """
-        Extracts the specified field from the specified `DataLine` object.
+        for i in self._get_files():
+            # Skips reading the file if its datalines are bound to be excluded. The
+            # dataline and its number are not evaluated by the file conditions. As
+            # files are evaluated prior to reading them, conditions which cannot be
+            # processed are also reported for files comprising no datalines.
+            if evaluate and not file_condition(DataLine(i, "", 0)):
+                continue
 
-        #### Params:
-        - field (Field): `Field` object comprising the field to be extracted.
-        - data (DataLine): `DataLine` object to extract data from.
-        """
-        return getattr(data, field.field)
+            try:
+                yield from (
+                    DataLine(i, line, index)
+                    for index, line in enumerate(self._read_datalines(i), 1)
+                )
+
+            except UnicodeDecodeError:
+                raise OperationError(
+                    "Cannot read bytes with 'text' filemode. Set "
+                    "filemode to 'bytes' to read byte data within files."
+                )
 
     def get_dataframe(
         self,
         fields: list[Field],
         columns: list[str],
         condition: Callable[[DataLine], bool],
+        file_condition: Callable[[DataLine], bool] = always_true,
     ) -> pd.DataFrame:
         """
         Returns a pandas DataFrame comprising the search records of all the
@@ -210,17 +289,16 @@ class FileDataQueryOperator:
         #### Params:
         - fields (list[str]): List of the desired metadata fields.
         - condition (Callable): Function for filtering data records.
+        - file_condition (Callable): Function for filtering files prior to reading them.
         """
 
-        # Generator object comprising search records of
-        # the files matching the specified condition.
-        records: Generator[list[Any], None, None] = (
-            [self._get_field(field, data) for field in fields]
-            for data in self._search_datalines()
-            if condition(data)
-        )
+        datalines: Iterator[DataLine] = self._search_datalines(file_condition)
 
-        return pd.DataFrame(records, columns=columns)
+        # Filters the datalines only if conditions are explicitly defined in the query.
+        if condition is not always_true:
+            datalines = filter(condition, datalines)
+
+        return _build_dataframe(datalines, fields, columns)
 
 
 class DirectoryQueryOperator:
@@ -243,17 +321,6 @@ class DirectoryQueryOperator:
         self._directory = directory
         self._recursive = recursive
 
-    @staticmethod
-    def _get_field(field: Field, directory: Directory) -> Any:
-        """
-        Extracts the specified field from the specified `Directory` object.
-
-        #### Params:
-        - field (Field): `Field` object comprising the field to be extracted.
-        - directory (Directory): `Directory` object to extract data from.
-        """
-        return getattr(directory, field.field)
-
     def get_dataframe(
         self,
         fields: list[Field],
@@ -270,20 +337,16 @@ class DirectoryQueryOperator:
         - condition (Callable): Function for filtering data records.
         """
 
-        directories: Generator[Directory, None, None] = (
-            Directory(directory)
-            for directory in tools.get_directories(self._directory, self._recursive)
+        directories: Iterator[Directory] = (
+            Directory.from_entry(entry)
+            for entry in tools.get_directory_entries(self._directory, self._recursive)
         )
 
-        # Generator object comprising search records of
-        # the files matching the specified condition.
-        records: Generator[list[Any], None, None] = (
-            [self._get_field(field, directory) for field in fields]
-            for directory in directories
-            if condition(directory)
-        )
+        # Filters the directories only if conditions are explicitly defined in the query.
+        if condition is not always_true:
+            directories = filter(condition, directories)
 
-        return pd.DataFrame(records, columns=columns)
+        return _build_dataframe(directories, fields, columns)
 
     def remove_directories(
         self, condition: Callable[[Directory], bool], skip_err: bool
@@ -300,21 +363,25 @@ class DirectoryQueryOperator:
         # the number of skipped directories if `skip_err` is set to `True`.
         ctr = skipped = 0
 
+        # Avoids creating `Directory` objects for evaluating the
+        # condition if no conditions are explicitly defined in the query.
+        evaluate: bool = condition is not always_true
+
         # Iterates through the subdirectories and deletes
         # individual directory tree(s) if the condition is met.
-        for subdir in tools.get_directories(self._directory, self._recursive):
-            if not condition(Directory(subdir)):
+        for entry in tools.get_directory_entries(self._directory, self._recursive):
+            if evaluate and not condition(Directory.from_entry(entry)):
                 continue
 
             try:
-                shutil.rmtree(subdir)
+                shutil.rmtree(entry.path)
 
             except PermissionError:
                 if skip_err:
                     skipped += 1
                     continue
 
-                raise OperationError(f"Permission Error: Cannot delete '{subdir}'")
+                raise OperationError(f"Permission Error: Cannot delete '{entry.path}'")
 
             else:
                 ctr += 1
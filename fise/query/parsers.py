@@ -11,27 +11,41 @@ extracting relevant data for further processing and evaluation.
 # (explicilty for search operation), path, path-type and the conditions defined
 # within the query. The initials are parsed beforehand.
 
+from stat import S_ISDIR, S_ISREG
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Generator
 
 from errors import QueryParseError
 from common import constants
 from .conditions import ConditionHandler
-from shared import DeleteQuery, SearchQuery, Directory, DataLine, Field, File, Size
-
-
-def _parse_path(subquery: list[str]) -> tuple[Path, int]:
+from shared import (
+    DeleteQuery,
+    SearchQuery,
+    Directory,
+    DataLine,
+    Field,
+    File,
+    Size,
+    always_true,
+)
+
+
+def _parse_path(subquery: list[str], lowered: list[str]) -> tuple[Path, int]:
     """
     Parses the file/directory path and its type from the specified sub-query.
     Also returns the index of the file/directory specification in the query
     relative to the specified subquery.
+
+    #### Params:
+    - subquery (list[str]): Subquery comprising the path specifications.
+    - lowered (list[str]): Lowered version of the specified subquery.
     """
 
     path_type: str = "relative"
-    path_specs_index: str = 0
+    path_specs_index: int = 0
 
-    if subquery[0].lower() in constants.PATH_TYPES:
-        path_type = subquery[0].lower()
+    if lowered[0] in constants.PATH_TYPES:
+        path_type = lowered[0]
         path_specs_index = 1
 
     raw_path: str = subquery[path_specs_index]
@@ -48,38 +62,147 @@ def _parse_path(subquery: list[str]) -> tuple[Path, int]:
     return path, path_specs_index
 
 
-def _get_from_keyword_index(subquery: list[str]) -> int:
-    """Returns the index of the `FROM` keyword in the specified subquery."""
+def _split_fields(attrs: list[str]) -> Generator[str, None, None]:
+    """
+    Yields individual comma-separated fields from the specified list of tokens.
+    Fields spanning across multiple tokens are concatenated before being yielded.
+
+    #### Params:
+    - attrs (list[str]): List of tokens comprising the query fields.
+    """
+
+    # Stores the trailing fragment of the last token which
+    # may continue as the leading fragment of the next token.
+    fragment: str = ""
+
+    for token in attrs:
+        *fields, last = token.split(",")
 
-    for i, kw in enumerate(subquery):
-        if kw.lower() == "from":
-            return i
+        for field in fields:
+            yield fragment + field
+            fragment = ""
 
-    raise QueryParseError("Cannot find the 'FROM' keyword in the query.")
+        fragment += last
 
+    yield fragment
 
-def _get_condition_handler(
-    subquery: list[str], operand: str
-) -> Callable[[File | DataLine | Directory], bool]:
+
+def _parse_fields(
+    attrs: list[str],
+    fields: tuple[str, ...],
+    aliases: dict[str, str],
+    lookup: frozenset[str],
+    size: bool = False,
+    lower_columns: bool = False,
+) -> tuple[list[Field | Size], list[str]]:
     """
-    Parses the conditions defined in the specified subquery
-    and returns a function for filtering data records.
+    Parses the search query fields and returns an array of parsed fields and columns.
+
+    #### Params:
+    - attrs (list[str]): List of tokens comprising the query fields.
+    - fields (tuple[str, ...]): Fields to be included upon specifying `*`.
+    - aliases (dict[str, str]): Field aliases mapped with corresponding fields.
+    - lookup (frozenset[str]): Valid fields along with their aliases excluding
+    the size field, which is explicitly parsed if `size` is set to `True`.
+    - size (bool): Whether to parse size fields as `Size` objects.
+    - lower_columns (bool): Whether to lowercase the field strings when adding
+    them to the columns instead of preserving their case.
+    """
+
+    parsed: list[Field | Size] = []
+    columns: list[str] = []
+
+    # Binds the append methods to local names to avoid
+    # looking them up on the lists upon every iteration.
+    add_field, add_column = parsed.append, columns.append
+
+    # Iterates through the specified tokens, parses and stores them in the lists.
+    for field in _split_fields(attrs):
+
+        # Keep a separate copy of the lowered string to avoid affecting
+        # the case of the field string when adding it to the columns.
+        col: str = field.lower()
+
+        if lower_columns:
+            field = col
+
+        # Regular fields are looked up first as they are the most common.
+        if col in lookup:
+            add_field(Field(aliases.get(col, col)))
+            add_column(field)
+
+        elif field == "*":
+            parsed += (Field(i) for i in fields)
+            columns += fields
+
+        elif size and col.startswith("size"):
+            # Parses size from the string and adds it to the `parsed` list.
+            add_field(Size.from_string(field))
+            add_column(field)
+
+        else:
+            raise QueryParseError(
+                f"Found an invalid field {field!r} in the search query."
+            )
+
+    return parsed, columns
+
+
+def _get_from_keyword_index(lowered: list[str]) -> int:
+    """
+    Returns the index of the `FROM` keyword in the specified lowered subquery.
+    """
+
+    try:
+        return lowered.index("from")
+
+    except ValueError:
+        raise QueryParseError("Cannot find the 'FROM' keyword in the query.")
+
+
+def _parse_conditions(
+    subquery: list[str], lowered: list[str], operand: str
+) -> ConditionHandler | None:
+    """
+    Parses the conditions defined in the specified subquery and returns a
+    `ConditionHandler` object, or `None` if no conditions are defined.
 
     #### Params:
     - subquery (list): Subquery comprising the query conditions.
+    - lowered (list): Lowered version of the specified subquery.
     - operand (str): Targeted operand in the query operation.
     """
 
-    # Returns a lambda function hardcoded to return `True` to include all the records
-    # during evaluation if no conditions are explicitly defined within the query.
     if not subquery:
-        return lambda _: True
+        return None
 
-    if subquery[0].lower() != "where":
+    if lowered[0] != "where":
         raise QueryParseError(f"Invalid query syntax around {' '.join(subquery)!r}")
 
     conditions: list[str] = subquery[1:]
-    handler = ConditionHandler(conditions, operand)
+
+    return ConditionHandler(conditions, operand)
+
+
+def _get_condition_handler(
+    subquery: list[str], lowered: list[str], operand: str
+) -> Callable[[File | DataLine | Directory], bool]:
+    """
+    Parses the conditions defined in the specified subquery
+    and returns a function for filtering data records.
+
+    #### Params:
+    - subquery (list): Subquery comprising the query conditions.
+    - lowered (list): Lowered version of the specified subquery.
+    - operand (str): Targeted operand in the query operation.
+    """
+
+    handler: ConditionHandler | None = _parse_conditions(subquery, lowered, operand)
+
+    # Returns the `always_true` function to include all the records during
+    # evaluation if no conditions are explicitly defined within the query.
+    if handler is None:
+        return always_true
 
     # Returns the evaluation method for filtering records.
     return handler.eval_conditions
@@ -90,63 +213,54 @@ class FileQueryParser:
     FileQueryParser defines methods for parsing file search and delete queries.
     """
 
-    __slots__ = "_query", "_operation", "_from_index"
+    __slots__ = "_query", "_query_lower", "_operation", "_from_index"
 
     _operand = "file"
-    _file_fields = set(constants.FILE_FIELDS) | constants.FILE_FIELD_ALIASES.keys()
+    _fields = constants.FILE_FIELDS
+    _field_aliases = constants.FILE_FIELD_ALIASES
+
+    # The size field is excluded as it is parsed separately as a `Size` object.
+    _lookup_fields = frozenset(_fields).union(_field_aliases).difference(("size",))
+
+    # Whether to parse size fields and lowercase the columns respectively.
+    _parse_size = True
+    _lower_columns = False
 
     def __init__(self, subquery: list[str], operation: constants.OPERATIONS) -> None:
         self._query = subquery
         self._operation = operation
 
+        # Lowers all the tokens at once to avoid lowering them
+        # individually for case-insensitive keyword matching.
+        self._query_lower = [token.lower() for token in subquery]
+
         # Stores the index of the `FROM` keyword in the specified subquery.
-        self._from_index = _get_from_keyword_index(subquery)
+        self._from_index = _get_from_keyword_index(self._query_lower)
 
-    def _parse_fields(
-        self, attrs: str | list[str]
-    ) -> tuple[list[Field | Size], list[str]]:
+    def _parse_fields(self, attrs: list[str]) -> tuple[list[Field | Size], list[str]]:
         """
         Parses the search query fields and returns an array of parsed fields and columns.
 
         #### Params:
-        - attrs (str | list[str]): String or a list of strings of query fields.
+        - attrs (list[str]): List of tokens comprising the query fields.
         """
-
-        fields: list[Field | Size] = []
-        columns: list[str] = []
-
-        # Iterates through the specified tokens, parses and stores them in the `fields` list.
-        for field in "".join(attrs).split(","):
-
-            # Keep a separate copy of the lowered string to avoid affecting
-            # the case of the field string when adding it to the columns.
-            col: str = field.lower()
-
-            if field == "*":
-                fields += (Field(i) for i in constants.FILE_FIELDS)
-                columns += constants.FILE_FIELDS
-
-            elif col.startswith("size"):
-                # Parses size from the string and adds it to the `fields` list.
-                fields.append(Size.from_string(field))
-                columns.append(field)
-
-            elif col in self._file_fields:
-                fields.append(Field(constants.FILE_FIELD_ALIASES.get(col, col)))
-                columns.append(field)
-
-            else:
-                raise QueryParseError(
-                    f"Found an invalid field {field!r} in the search query."
-                )
-
-        return fields, columns
+        return _parse_fields(
+            attrs,
+            self._fields,
+            self._field_aliases,
+            self._lookup_fields,
+            size=self._parse_size,
+            lower_columns=self._lower_columns,
+        )
 
     def _parse_directory(self) -> tuple[Path, int]:
         """
         Parses the directory path and its metadata.
         """
-        path, index = _parse_path(self._query[self._from_index + 1:])
+        path, index = _parse_path(
+            self._query[self._from_index + 1:],
+            self._query_lower[self._from_index + 1:],
+        )
 
         if not path.is_dir():
             raise QueryParseError("The specified path for lookup must be a directory.")
@@ -166,7 +280,9 @@ class FileQueryParser:
         # Extracts the function for filtering file records.
         condition: Callable[[File | DataLine | Directory], bool] = (
             _get_condition_handler(
-                self._query[self._from_index + index + 2:], self._operand
+                self._query[self._from_index + index + 2:],
+                self._query_lower[self._from_index + index + 2:],
+                self._operand,
             )
         )
 
@@ -183,7 +299,9 @@ class FileQueryParser:
         # Extracts the function for filtering file records.
         condition: Callable[[File | DataLine | Directory], bool] = (
             _get_condition_handler(
-                self._query[self._from_index + index + 2:], self._operand
+                self._query[self._from_index + index + 2:],
+                self._query_lower[self._from_index + index + 2:],
+                self._operand,
             )
         )
 
@@ -205,53 +323,61 @@ class FileDataQueryParser:
     FileDataQueryParser defines methods for parsing file data search queries.
     """
 
-    __slots__ = "_query", "_from_index"
+    __slots__ = "_query", "_query_lower", "_from_index"
 
     _operand = "data"
-    _data_fields = set(constants.DATA_FIELDS) | constants.DATA_FIELD_ALIASES.keys()
+    _fields = constants.DATA_FIELDS
+    _field_aliases = constants.DATA_FIELD_ALIASES
+    _lookup_fields = frozenset(_fields).union(_field_aliases)
+
+    _parse_size = False
+    _lower_columns = True
 
     def __init__(self, subquery: list[str]) -> None:
         self._query = subquery
 
+        # Lowers all the tokens at once to avoid lowering them
+        # individually for case-insensitive keyword matching.
+        self._query_lower = [token.lower() for token in subquery]
+
         # Stores the index of the `FROM` keyword in the specified subquery.
-        self._from_index = _get_from_keyword_index(subquery)
+        self._from_index = _get_from_keyword_index(self._query_lower)
 
-    def _parse_fields(self, attrs: list[str] | str) -> tuple[list[Field], list[str]]:
+    def _parse_fields(self, attrs: list[str]) -> tuple[list[Field], list[str]]:
         """
         Parses the search query fields and returns an array of parsed fields and columns.
 
         #### Params:
-        - attrs (str | list[str]): String or a list of strings of query fields.
+        - attrs (list[str]): List of tokens comprising the query fields.
         """
-
-        fields: list[Field] = []
-        columns: list[str] = []
-
-        # Iterates through the specified tokens, parses and stores them in the `fields` list.
-        for field in "".join(attrs).lower().split(","):
-            if field == "*":
-                fields += (Field(i) for i in constants.DATA_FIELDS)
-                columns += constants.DATA_FIELDS
-
-            elif field in self._data_fields:
-                fields.append(Field(constants.DATA_FIELD_ALIASES.get(field, field)))
-                columns.append(field)
-
-            else:
-                raise QueryParseError(
-                    f"Found an invalid field {field!r} in the search query."
-                )
-
-        return fields, columns
+        return _parse_fields(
+            attrs,
+            self._fields,
+            self._field_aliases,
+            self._lookup_fields,
+            size=self._parse_size,
+            lower_columns=self._lower_columns,
+        )
 
     def _parse_path(self) -> tuple[Path, int]:
         """
         Parses the file/directory path and its metadata.
         """
 
-        path, index = _parse_path(self._query[self._from_index + 1:])
+        path, index = _parse_path(
+            self._query[self._from_index + 1:],
+            self._query_lower[self._from_index + 1:],
+        )
+
+        # Extracts the file mode with a single `stat` call instead of
+        # individually verifying whether the path is a directory or file.
+        try:
+            mode: int = path.stat().st_mode
+
+        except (OSError, ValueError):
+            mode = 0
 
-        if not (path.is_dir() or path.is_file()):
+        if not (S_ISDIR(mode) or S_ISREG(mode)):
             raise QueryParseError(
                 "The specified path for lookup must be a file or directory."
             )
@@ -266,14 +392,23 @@ class FileDataQueryParser:
         fields, columns = self._parse_fields(self._query[: self._from_index])
         path, index = self._parse_path()
 
-        # Extracts the function for filtering file records.
-        condition: Callable[[File | DataLine | Directory], bool] = (
-            _get_condition_handler(
-                self._query[self._from_index + index + 2:], self._operand
-            )
+        handler: ConditionHandler | None = _parse_conditions(
+            self._query[self._from_index + index + 2:],
+            self._query_lower[self._from_index + index + 2:],
+            self._operand,
         )
 
-        return SearchQuery(path, condition, fields, columns)
+        if handler is None:
+            return SearchQuery(path, always_true, fields, columns, always_true)
+
+        # Extracts the functions for filtering datalines and files respectively.
+        return SearchQuery(
+            path,
+            handler.eval_conditions,
+            fields,
+            columns,
+            handler.get_file_condition(),
+        )
 
 
 class DirectoryQueryParser(FileQueryParser):
@@ -281,35 +416,13 @@ class DirectoryQueryParser(FileQueryParser):
     DirectoryQueryParser defines methods for parsing directory search/delete queries.
     """
 
-    __slots__ = "_query", "_operation", "_from_index"
+    # All the instance attributes are already declared within the parent class.
+    __slots__ = ()
 
     _operand = "dir"
-    _dir_fields = constants.DIR_FIELDS | constants.DIR_FIELD_ALIASES.keys()
-
-    def _parse_fields(self, attrs: list[str] | str) -> tuple[list[Field], list[str]]:
-        """
-        Parses the search query fields and returns an array of parsed fields and columns.
-
-        #### Params:
-        - attrs (str | list[str]): String or a list of strings of query fields to be parsed.
-        """
-
-        fields: list[Field] = []
-        columns: list[str] = []
-
-        # Iterates through the specified tokens, parses and stores them in the `fields` list.
-        for field in "".join(attrs).lower().split(","):
-            if field == "*":
-                fields += (Field(i) for i in constants.DIR_FIELDS)
-                columns += constants.DIR_FIELDS
-
-            elif field in self._dir_fields:
-                fields.append(Field(constants.DIR_FIELD_ALIASES.get(field, field)))
-                columns.append(field)
-
-            else:
-                raise QueryParseError(
-                    f"Found an invalid field {field!r} in the search query."
-                )
+    _fields = constants.DIR_FIELDS
+    _field_aliases = constants.DIR_FIELD_ALIASES
+    _lookup_fields = frozenset(_fields).union(_field_aliases)
 
-        return fields, columns
+    _parse_size = False
+    _lower_columns = True
@@ -6,12 +6,13 @@ This module comprises data-classes shared across the project
 assisting various other classes and functions defined within it.
 """
 
-import re
 import sys
-from dataclasses import dataclass
-from typing import ClassVar, Callable, Literal, Any
+from dataclasses import dataclass, field as dataclass_field
+from typing import Callable, Literal, Any
 from pathlib import Path
 
+import numpy as np
+
 import ospecs
 from common import constants
 from errors import QueryParseError
@@ -28,10 +29,10 @@ class File(Entity):
     accessing all file metadata attributes.
     """
 
-    __slots__ = "_path", "_stats"
+    __slots__ = ()
 
+    # Derived from the path alone, and hence not wrapped with `ospecs.safe_extract_field`.
     @property
-    @ospecs.safe_extract_field
     def filetype(self) -> str | None:
         return self._path.suffix or None
 
@@ -62,29 +63,27 @@ class DataLine:
         self._data = data
         self._lineno = lineno
 
+    # The following fields only access the stored attributes and cannot fail,
+    # and are hence not wrapped with `ospecs.safe_extract_field`.
+
     @property
-    @ospecs.safe_extract_field
     def path(self) -> str:
         return str(self._file)
 
     @property
-    @ospecs.safe_extract_field
     def name(self) -> str:
         return self._file.name
 
     @property
-    @ospecs.safe_extract_field
     def dataline(self) -> str:
         # Strips the leading binary notation and quotes if the dataline is a bytes object.
         return str(self._data)[2:-1] if isinstance(self._data, bytes) else self._data
 
     @property
-    @ospecs.safe_extract_field
     def lineno(self) -> int:
         return self._lineno
 
     @property
-    @ospecs.safe_extract_field
     def filetype(self) -> str | None:
         return self._file.suffix or None
 
@@ -95,7 +94,7 @@ class Directory(Entity):
     accessing all directory metadata attributes.
     """
 
-    __slots__ = "_path", "_stats"
+    __slots__ = ()
 
 
 @dataclass(slots=True, frozen=True, eq=False)
@@ -105,10 +104,12 @@ class Size:
     field and defines a mechanism for parsing the field.
     """
 
-    # Regex pattern for matching size field specifications.
-    _size_field_pattern: ClassVar[re.Pattern] = re.compile(rf"^size(\[.*])?$")
-
     unit: str
+    divisor: int | float = dataclass_field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Stores the divisor for the unit once instead of looking it up for each file.
+        object.__setattr__(self, "divisor", constants.SIZE_CONVERSION_MAP[self.unit])
 
     @classmethod
     def from_string(cls, field: str):
@@ -117,7 +118,12 @@ class Size:
         the specified size field specifications.
         """
 
-        if not cls._size_field_pattern.match(field.lower()):
+        field_lower: str = field.lower()
+
+        # Verifies whether the field is either `size` or `size[<unit>]`.
+        if field_lower != "size" and not (
+            field_lower.startswith("size[") and field_lower.endswith("]")
+        ):
             raise QueryParseError(f"Found an invalid field {field!r} in the query.")
 
         unit: str = field[5:-1]
@@ -128,13 +134,34 @@ class Size:
 
         # Initializes with "B" -> bytes unit if not explicitly specified.
         return cls(unit or "B")
-    
+
     def get_size(self, file: File) -> float:
         """
         Extracts the size from the specified `File` object and
         converts it in accordance with the stored size unit.
         """
-        return round(file.size / constants.SIZE_CONVERSION_MAP.get(self.unit), 5)
+        return round(file.size / self.divisor, 5)
+
+    def get_sizes(self, sizes: np.ndarray) -> np.ndarray:
+        """
+        Converts the specified array of sizes in bytes in accordance with the stored
+        size unit. The sizes are rounded in the same manner as in `get_size` to keep
+        them consistent with the ones evaluated in the query conditions.
+        """
+
+        sizes = sizes / self.divisor
+        scaled: np.ndarray = sizes * 1e5
+
+        # `np.rint` rounds half to even and the scaled sizes may not be exact, and
+        # hence the sizes lying on or around a rounding tie are rounded individually
+        # with the builtin `round` which rounds the exact values instead.
+        rounded: np.ndarray = np.rint(scaled) / 1e5
+        ties: np.ndarray = (
+            np.abs(scaled - np.floor(scaled) - 0.5) <= np.abs(scaled) * 2**-50
+        )
+
+        rounded[ties] = [round(size, 5) for size in sizes[ties].tolist()]
+        return rounded
 
 
 @dataclass(slots=True, frozen=True, eq=False)
@@ -146,6 +173,14 @@ class Field:
     field: str
 
 
+def always_true(_: File | DataLine | Directory) -> bool:
+    """
+    Filtering function for including all the records. Used in place of the
+    condition handler if no conditions are defined explicitly in the query.
+    """
+    return True
+
+
 @dataclass(slots=True, frozen=True, eq=False)
 class BaseQuery:
     """
@@ -165,6 +200,10 @@ class SearchQuery(BaseQuery):
     fields: list[Field | Size]
     columns: list[str]
 
+    # Function for filtering files prior to reading them, only used with data search
+    # queries for conditions comprising fields shared by all datalines of a file.
+    file_condition: Callable[[DataLine], bool] = always_true
+
 
 class DeleteQuery(BaseQuery):
     """
@@ -216,5 +255,5 @@ class Condition:
     """
 
     operand1: Any
-    operator: str
+    operator: int
     operand2: Any
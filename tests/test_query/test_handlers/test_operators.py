@@ -35,6 +35,7 @@ import pandas as pd
 
 import utils
 import reset_tests
+from errors import OperationError
 from fise.common import constants
 from fise.shared import File, Directory, Field, DataLine
 from fise.query.operators import (
@@ -261,6 +262,56 @@ class TestFileDataQueryOperator:
         if verify:
             verify_search_operation(f"/data/bytes/search/test{index}", data)
 
+    @staticmethod
+    def create_large_files(directory: Path) -> list[str]:
+        """
+        Creates text and binary files larger than the maximum size up to which files
+        are read at once within the specified directory, and returns the datalines
+        comprised by the text file.
+        """
+
+        lines: list[str] = [f"dataline {i}\n" for i in range(10_000)]
+
+        (directory / "large.txt").write_text("".join(lines))
+        (directory / "large.bin").write_bytes(b"\xff\xfe" * 40_000)
+
+        for file in directory.iterdir():
+            assert file.stat().st_size > FileDataQueryOperator._max_read_size
+
+        return lines
+
+    @pytest.mark.parametrize("filemode", ["text", "bytes"])
+    def test_large_file_search_operation(self, tmp_path: Path, filemode: str) -> None:
+        """
+        Tests file data query operator with files streamed instead of being read at once.
+        """
+
+        lines: list[str] = self.create_large_files(tmp_path)
+
+        if filemode == "bytes":
+            lines = [str(line.encode())[2:-1] for line in lines]
+
+        operator = FileDataQueryOperator(tmp_path / "large.txt", False, filemode)
+        data: pd.DataFrame = operator.get_dataframe(
+            [Field("lineno"), Field("dataline")], ["lineno", "dataline"], self.condition3
+        )
+
+        assert data["lineno"].tolist() == list(range(1, 10))
+        assert data["dataline"].tolist() == lines[:9]
+
+    def test_large_file_decode_error(self, tmp_path: Path) -> None:
+        """
+        Tests file data query operator with text search operations
+        on large files comprising byte data.
+        """
+
+        self.create_large_files(tmp_path)
+
+        operator = FileDataQueryOperator(tmp_path / "large.bin", False, "text")
+
+        with pytest.raises(OperationError):
+            operator.get_dataframe([Field("dataline")], ["dataline"], self.condition3)
+
 
 class TestDirectoryQueryOperator:
     """Tests the DirectoryQueryOperator class"""
@@ -31,7 +31,7 @@ from typing import Any
 
 import pytest
 
-from fise.shared import SearchQuery, DeleteQuery
+from shared import SearchQuery, DeleteQuery, DataLine, always_true
 from fise.common import tools, constants
 from fise.query.parsers import (
     DirectoryQueryParser,
@@ -212,6 +212,7 @@ class TestFileDataQueryParser:
         "name, path, dataline FROM ABSOLUTE '.'",
         "path, lineno, dataline FROM RELATIVE . WHERE type = '.py'",
         "* FROM '.' WHERE lineno BETWEEN (0, 100)",
+        "Name, LINENO FROM .",
     ]
 
     search_query_with_field_aliases_test_params = [
@@ -225,6 +226,7 @@ class TestFileDataQueryParser:
         [True, ["name", "path", "dataline"]],
         [False, ["path", "lineno", "dataline"]],
         [False, list(constants.DATA_FIELDS)],
+        [False, ["name", "lineno"]],
     ]
 
     search_query_with_field_aliases_test_results = [
@@ -270,6 +272,49 @@ class TestFileDataQueryParser:
 
         assert [field.field for field in search_query.fields] == fields
 
+    # Test results comprise the names of the files included and excluded by the
+    # file condition respectively, or `None` if no file condition is extracted.
+    file_condition_test_params = [
+        "* FROM . WHERE name = 'todo.txt' AND lineno < 3",
+        "* FROM . WHERE name = 'todo.txt' OR lineno < 3",
+        "* FROM . WHERE (name = 'todo.txt' OR filetype = '.md') AND lineno < 3",
+        "* FROM . WHERE lineno < 3",
+    ]
+
+    file_condition_test_results = [
+        [["todo.txt"], ["specs.txt", "report-2024.xlsx"]],
+        None,
+        [["todo.txt", "README.md"], ["specs.txt", "report-2024.xlsx"]],
+        None,
+    ]
+
+    @pytest.mark.parametrize(
+        ("subquery", "results"),
+        zip(file_condition_test_params, file_condition_test_results),
+    )
+    def test_search_query_file_condition(
+        self, subquery: str, results: list[list[str]] | None
+    ) -> None:
+        """
+        Tests the file condition extracted by the file data query parser.
+        """
+
+        query: list[str] = tools.parse_query(subquery)
+        search_query: SearchQuery = FileDataQueryParser(query).parse_query()
+
+        if results is None:
+            assert search_query.file_condition is always_true
+            return
+
+        included, excluded = results
+
+        assert all(
+            search_query.file_condition(DataLine(Path(i), "", 0)) for i in included
+        )
+        assert not any(
+            search_query.file_condition(DataLine(Path(i), "", 0)) for i in excluded
+        )
+
 
 class TestDirectoryQueryParser:
     """Tests the DirectoryQueryParser class"""
@@ -280,6 +325,7 @@ class TestDirectoryQueryParser:
         "access_time,modify_time from RELATIVE . WHERE name in ('docs', 'documents')",
         "name, path,access_time FROM . WHERE atime >= '2023-04-04' OR ctime >= '2023-12-04'",
         "* FROM ABSOLUTE '.' WHERE atime >= '2024-02-20'",
+        "NAME, Parent FROM .",
     ]
 
     search_query_with_field_aliases_test_params = [
@@ -299,6 +345,7 @@ class TestDirectoryQueryParser:
         [False, ["access_time", "modify_time"]],
         [False, ["name", "path", "access_time"]],
         [True, list(constants.DIR_FIELDS)],
+        [False, ["name", "parent"]],
     ]
 
     search_query_with_field_aliases_test_results = [
@@ -14,10 +14,12 @@ from pathlib import Path
 import pytest
 import pandas as pd
 
+from errors import OperationError, QueryParseError
 from fise.common import constants
 from fise.query import QueryHandler
 
 TEST_DIRECTORY = Path(__file__).parents[1] / "test_directory"
+DATA_TEST_DIRECTORY = TEST_DIRECTORY / "data"
 FILE_DIR_TEST_DIRECTORY = TEST_DIRECTORY / "file_dir"
 TEST_RECORDS_FILE = Path(__file__).parent / "test_search_query.hdf"
 
@@ -79,6 +81,21 @@ class TestFileSearchQuery:
         "WHERE (filetype = '.md') OR atime >= '2024-02-25'",
     ]
 
+    quoted_comma_conditions_test_params = [
+        f"SELECT name FROM '{FILE_DIR_TEST_DIRECTORY}' WHERE name IN ('TODO', 'a, b')",
+        f"SELECT name FROM '{FILE_DIR_TEST_DIRECTORY}' WHERE name IN ('README.md,TODO')",
+        f"SELECT name FROM '{FILE_DIR_TEST_DIRECTORY}' WHERE "
+        "name BETWEEN ('README.md', 'TODO, z')",
+    ]
+
+    quoted_comma_conditions_test_results = [["TODO"], [], ["README.md", "TODO"]]
+
+    invalid_operation_params_test_params = [
+        f"SELECT[TYPE  FILE] * FROM '{FILE_DIR_TEST_DIRECTORY}'",
+        f"SELECT[TYPE FILE DIR] * FROM '{FILE_DIR_TEST_DIRECTORY}'",
+        f"SELECT[TYPE ] * FROM '{FILE_DIR_TEST_DIRECTORY}'",
+    ]
+
     @pytest.mark.parametrize("query", basic_query_syntax_test_params)
     def test_basic_query_syntax(self, query: str) -> None:
         """Tests basic syntax for file search queries"""
@@ -116,6 +133,41 @@ class TestFileSearchQuery:
         """Tests file nested search query conditions"""
         examine_search_query(query)
 
+    @pytest.mark.parametrize(
+        ("query", "names"),
+        zip(quoted_comma_conditions_test_params, quoted_comma_conditions_test_results),
+    )
+    def test_quoted_comma_conditions(self, query: str, names: list[str]) -> None:
+        """Tests file search query conditions comprising commas within quoted strings"""
+
+        data: pd.DataFrame = QueryHandler(query).handle()
+        assert sorted(data["name"]) == names
+
+    @pytest.mark.parametrize("query", invalid_operation_params_test_params)
+    def test_invalid_operation_params(
+        self, query: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Tests file search queries comprising invalid operation parameters"""
+
+        with pytest.raises(QueryParseError):
+            QueryHandler(query).handle()
+
+        # The error description is only printed to the standard error stream.
+        assert "Invalid query syntax around" in capsys.readouterr().err
+
+    def test_size_rounding_tie(self, tmp_path: Path) -> None:
+        """
+        Tests file search queries comprising sizes which land exactly on a rounding
+        tie, verifying the extracted sizes are consistent with the query conditions.
+        """
+
+        (tmp_path / "tie.bin").write_bytes(b"\0" * 1_925_000)
+
+        query: str = f"SELECT name, size[GB] FROM '{tmp_path}' WHERE size[GB] = 0.00193"
+        data: pd.DataFrame = QueryHandler(query).handle()
+
+        assert data["size[GB]"].tolist() == [0.00193]
+
 
 class TestDirSearchQuery:
     """Tests the QueryHandler class with directory search queries"""
@@ -198,3 +250,77 @@ class TestDirSearchQuery:
     def test_nested_query_conditions(self, query: str) -> None:
         """Tests directory nested search query conditions"""
         examine_search_query(query)
+
+
+class TestDataSearchQuery:
+    """Tests the QueryHandler class with data search queries"""
+
+    file_conditions_test_params = [
+        f"R SELECT[TYPE DATA] name, lineno FROM '{DATA_TEST_DIRECTORY}' "
+        "WHERE name = 'todo.txt' AND lineno < 3",
+        f"R SELECT[TYPE DATA] name, lineno FROM '{DATA_TEST_DIRECTORY}' "
+        "WHERE (name = 'todo.txt' OR filetype = '.md') AND lineno < 3",
+    ]
+
+    # Files are not filtered prior to reading them if any of the conditions are
+    # separated by the `or` operator, and hence all the files are read including
+    # the Excel files comprising binary data, requiring the bytes filemode.
+    unfiltered_file_conditions_test_params = [
+        f"R SELECT[TYPE DATA, MODE BYTES] name, lineno FROM '{DATA_TEST_DIRECTORY}' "
+        "WHERE name = 'todo.txt' OR lineno < 3",
+    ]
+
+    @pytest.mark.parametrize("query", file_conditions_test_params)
+    def test_file_conditions(self, query: str) -> None:
+        """
+        Tests data search queries comprising file conditions joined with the `and`
+        operator, which exclude the remaining files without reading them.
+        """
+
+        data: pd.DataFrame = QueryHandler(query).handle()
+
+        assert set(data["name"]) == {"todo.txt"}
+        assert sorted(data["lineno"]) == [1, 2]
+
+    @pytest.mark.parametrize("query", unfiltered_file_conditions_test_params)
+    def test_unfiltered_file_conditions(self, query: str) -> None:
+        """
+        Tests data search queries comprising file conditions joined with the `or`
+        operator, which require reading all the files within the directory.
+        """
+
+        data: pd.DataFrame = QueryHandler(query).handle()
+        names: set[str] = {i.name for i in DATA_TEST_DIRECTORY.rglob("*") if i.is_file()}
+
+        assert set(data["name"]) == names
+
+    def test_empty_file_conditions(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """
+        Tests data search queries comprising file conditions with files comprising
+        no datalines, which are evaluated by the file conditions prior to reading.
+        """
+
+        (tmp_path / "empty.txt").touch()
+
+        query: str = (
+            f"SELECT[TYPE DATA] name, lineno FROM '{tmp_path}' "
+            "WHERE name = 'empty.txt' AND lineno < 3"
+        )
+
+        data: pd.DataFrame = QueryHandler(query).handle()
+
+        assert data.empty
+        assert not capsys.readouterr().err
+
+        query = (
+            f"SELECT[TYPE DATA] name, lineno FROM '{tmp_path}' "
+            "WHERE name > 5 AND lineno < 3"
+        )
+
+        with pytest.raises(OperationError):
+            QueryHandler(query).handle()
+
+        # The error description is only printed to the standard error stream.
+        assert "Unable to process the query conditions" in capsys.readouterr().err
@@ -3,11 +3,14 @@ This module comprises test cases for verifying the utility
 functions defined within the common/tools.py module in FiSE.
 """
 
-from typing import Generator
+import os
+import sys
+from typing import Generator, Iterator, Any
 from pathlib import Path
 
 import pandas as pd
 import pytest
+import sqlalchemy
 
 from fise.common import tools
 
@@ -127,6 +130,151 @@ def test_get_directories_function(ctr: int, path: Path, recur: bool) -> None:
     )
 
 
+def create_symlink_tree(root: Path) -> None:
+    """
+    Creates a directory tree comprising symbolic links to a shared directory
+    and symbolic links pointing back to ancestor directories within `root`.
+    """
+
+    (root / "target" / "sub").mkdir(parents=True)
+    (root / "c" / "d").mkdir(parents=True)
+
+    for file in ("target/f.txt", "target/sub/g.txt", "c/d/h.txt"):
+        (root / file).touch()
+
+    (root / "a").symlink_to(root / "target", target_is_directory=True)
+    (root / "b").symlink_to(root / "target", target_is_directory=True)
+    (root / "c" / "d" / "up").symlink_to(root / "c", target_is_directory=True)
+    (root / "c" / "top").symlink_to(root, target_is_directory=True)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires symbolic links")
+def test_get_files_function_with_symlinks(tmp_path: Path) -> None:
+    """
+    Tests the `tools.get_files` function with symbolic links to shared
+    directories and symbolic link cycles within the directory tree.
+    """
+
+    create_symlink_tree(tmp_path)
+
+    files: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_files(tmp_path, True)
+    )
+
+    assert files == [
+        "a/f.txt", "a/sub/g.txt", "b/f.txt", "b/sub/g.txt",
+        "c/d/h.txt", "target/f.txt", "target/sub/g.txt",
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires symbolic links")
+def test_get_directories_function_with_symlinks(tmp_path: Path) -> None:
+    """
+    Tests the `tools.get_directories` function with symbolic links to shared
+    directories and symbolic link cycles within the directory tree.
+    """
+
+    create_symlink_tree(tmp_path)
+
+    directories: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_directories(tmp_path, True)
+    )
+
+    assert directories == [
+        "a", "a/sub", "b", "b/sub", "c", "c/d",
+        "c/d/up", "c/top", "target", "target/sub",
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires symbolic links")
+def test_directory_functions_without_inodes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests the `tools.get_files` and `tools.get_directories` functions with symbolic
+    links on platforms where the device and inode numbers are unavailable, wherein
+    the symbolic links are not followed while regular directories are traversed.
+    """
+
+    create_symlink_tree(tmp_path)
+
+    # Stats of the directories for which the device and inode numbers were requested.
+    stats: list[os.stat_result] = []
+
+    def get_directory_key(stat: os.stat_result) -> tuple[int, int]:
+        stats.append(stat)
+        return 0, 0
+
+    monkeypatch.setattr(tools, "_get_directory_key", get_directory_key)
+
+    files: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_files(tmp_path, True)
+    )
+
+    assert stats
+    assert files == ["c/d/h.txt", "target/f.txt", "target/sub/g.txt"]
+
+    directories: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_directories(tmp_path, True)
+    )
+
+    assert directories == [
+        "a", "b", "c", "c/d", "c/d/up", "c/top", "target", "target/sub",
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires symbolic links")
+def test_directory_functions_with_symlink_stats(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests the `tools.get_files` and `tools.get_directories` functions with symbolic
+    links, verifying that the ancestor directories are only stated once and that
+    symbolic links which cannot be stated are skipped.
+    """
+
+    create_symlink_tree(tmp_path)
+
+    stat = os.stat
+    paths: list[str] = []
+
+    def stat_path(path: str | Path, **kwargs: Any) -> os.stat_result:
+        paths.append(str(path))
+
+        if Path(path) == tmp_path / "b":
+            raise FileNotFoundError(path)
+
+        return stat(path, **kwargs)
+
+    monkeypatch.setattr(tools.os, "stat", stat_path)
+
+    files: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_files(tmp_path, True)
+    )
+
+    assert paths.count(str(tmp_path)) == 1
+    assert files == [
+        "a/f.txt", "a/sub/g.txt", "c/d/h.txt", "target/f.txt", "target/sub/g.txt",
+    ]
+
+    paths.clear()
+
+    directories: list[str] = sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tools.get_directories(tmp_path, True)
+    )
+
+    assert paths.count(str(tmp_path)) == 1
+    assert directories == [
+        "a", "a/sub", "b", "c", "c/d", "c/d/up", "c/top", "target", "target/sub",
+    ]
+
+
 @pytest.mark.parametrize("file", EXPORT_FILE_TEST_PARAMS)
 def test_file_export_function(
     file: str, data: pd.DataFrame = SAMPLE_EXPORT_FILE_DATA
@@ -140,3 +288,34 @@ def test_file_export_function(
     assert path.is_file()
 
     path.unlink()
+
+
+def test_sqlite_export_function(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests the `tools.export_to_sql` function with a SQLite database
+    and more records than inserted within a single chunk.
+    """
+
+    database: Path = tmp_path / "records.db"
+    data = pd.DataFrame({"name": [f"file{i}" for i in range(25)], "size": range(25)})
+
+    # Inputs the path to the database file followed by the table name.
+    responses: Iterator[str] = iter((str(database), "records"))
+
+    monkeypatch.setattr("builtins.input", lambda _: next(responses))
+    monkeypatch.setattr(tools.constants, "SQL_EXPORT_CHUNK_SIZE", 10)
+
+    tools.export_to_sql(data, "sqlite")
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{database}")
+
+    try:
+        with engine.connect() as conn:
+            records: pd.DataFrame = pd.read_sql_table("records", conn)
+
+    finally:
+        engine.dispose()
+
+    assert records.equals(data)